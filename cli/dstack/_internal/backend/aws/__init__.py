@@ -1,14 +1,17 @@
+import logging
+import threading
 from datetime import datetime
-from typing import Generator, List, Optional
+from typing import Dict, Generator, List, Optional
 
 import boto3
 from botocore.client import BaseClient
+from botocore.config import Config
 
 from dstack._internal.backend.aws import logs
 from dstack._internal.backend.aws.compute import AWSCompute
 from dstack._internal.backend.aws.config import AWSConfig
 from dstack._internal.backend.aws.secrets import AWSSecretsManager
-from dstack._internal.backend.aws.storage import AWSStorage
+from dstack._internal.backend.aws.storage import TRANSFER_MAX_CONCURRENCY, AWSStorage
 from dstack._internal.backend.base import Backend
 from dstack._internal.backend.base import artifacts as base_artifacts
 from dstack._internal.backend.base import cache as base_cache
@@ -28,13 +31,24 @@ from dstack._internal.core.secret import Secret
 from dstack._internal.core.tag import TagHead
 from dstack._internal.utils.common import PathLike
 
+logger = logging.getLogger(__name__)
+
+MAX_POOL_CONNECTIONS = 64
+
+# Number of artifact files downloaded concurrently. Large files are additionally split into
+# ranged GETs by S3Transfer, so the total number of requests stays within the connection pool.
+DOWNLOAD_MAX_WORKERS = MAX_POOL_CONNECTIONS // TRANSFER_MAX_CONCURRENCY
+
+# Number of jobs whose request heads are fetched concurrently when listing runs
+RUN_HEADS_MAX_WORKERS = 32
+
+# Clients used by most backend calls; iam, sts and secretsmanager are only created on demand
+WARM_UP_CLIENT_NAMES = ["s3", "ec2", "logs"]
+
 
 class AwsBackend(Backend):
     NAME = "aws"
     backend_config: AWSConfig
-    _storage: AWSStorage
-    _compute: AWSCompute
-    _secrets_manager: AWSSecretsManager
 
     def __init__(
         self,
@@ -49,22 +63,17 @@ class AwsBackend(Backend):
             )
         else:
             self._session = boto3.session.Session(region_name=self.backend_config.region_name)
-        self._storage = AWSStorage(
-            s3_client=self._s3_client(), bucket_name=self.backend_config.bucket_name
-        )
-        self._compute = AWSCompute(
-            ec2_client=self._ec2_client(),
-            iam_client=self._iam_client(),
-            bucket_name=self.backend_config.bucket_name,
-            region_name=self.backend_config.region_name,
-            subnet_id=self.backend_config.subnet_id,
-        )
-        self._secrets_manager = AWSSecretsManager(
-            secretsmanager_client=self._secretsmanager_client(),
-            iam_client=self._iam_client(),
-            sts_client=self._sts_client(),
-            bucket_name=self.backend_config.bucket_name,
+        self._botocore_config = Config(
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            retries={"mode": "adaptive", "max_attempts": 10},
+            tcp_keepalive=True,
         )
+        self._clients: Dict[str, BaseClient] = {}
+        # boto3 sessions are not thread-safe, and clients are created lazily from hub workers
+        self._clients_lock = threading.Lock()
+        self._storage_instance: Optional[AWSStorage] = None
+        self._compute_instance: Optional[AWSCompute] = None
+        self._secrets_manager_instance: Optional[AWSSecretsManager] = None
 
     @classmethod
     def load(cls) -> Optional["AwsBackend"]:
@@ -75,6 +84,46 @@ class AwsBackend(Backend):
             backend_config=config,
         )
 
+    @property
+    def _storage(self) -> AWSStorage:
+        if self._storage_instance is None:
+            self._storage_instance = AWSStorage(
+                s3_client=self._s3_client(), bucket_name=self.backend_config.bucket_name
+            )
+        return self._storage_instance
+
+    @property
+    def _compute(self) -> AWSCompute:
+        if self._compute_instance is None:
+            self._compute_instance = AWSCompute(
+                ec2_client=self._ec2_client(),
+                get_iam_client=self._iam_client,
+                bucket_name=self.backend_config.bucket_name,
+                region_name=self.backend_config.region_name,
+                subnet_id=self.backend_config.subnet_id,
+            )
+        return self._compute_instance
+
+    @property
+    def _secrets_manager(self) -> AWSSecretsManager:
+        if self._secrets_manager_instance is None:
+            self._secrets_manager_instance = AWSSecretsManager(
+                secretsmanager_client=self._secretsmanager_client(),
+                get_iam_client=self._iam_client,
+                get_sts_client=self._sts_client,
+                bucket_name=self.backend_config.bucket_name,
+            )
+        return self._secrets_manager_instance
+
+    def warm_up(self):
+        # Creating a client loads the service model from disk
+        for client_name in WARM_UP_CLIENT_NAMES:
+            try:
+                self._get_client(client_name)
+            except Exception:
+                # The error will surface again when the client is actually used
+                logger.debug("Failed to warm up the AWS %s client", client_name, exc_info=True)
+
     def _s3_client(self) -> BaseClient:
         return self._get_client("s3")
 
@@ -94,7 +143,12 @@ class AwsBackend(Backend):
         return self._get_client("sts")
 
     def _get_client(self, client_name: str) -> BaseClient:
-        return self._session.client(client_name)
+        with self._clients_lock:
+            client = self._clients.get(client_name)
+            if client is None:
+                client = self._session.client(client_name, config=self._botocore_config)
+                self._clients[client_name] = client
+        return client
 
     def predict_instance_type(self, job: Job) -> Optional[InstanceType]:
         return base_jobs.predict_job_instance(self._compute, job)
@@ -140,6 +194,7 @@ class AwsBackend(Backend):
             job_heads,
             include_request_heads,
             interrupted_job_new_status,
+            max_workers=RUN_HEADS_MAX_WORKERS,
         )
 
     def poll_logs(
@@ -186,6 +241,7 @@ class AwsBackend(Backend):
             artifacts=artifacts,
             output_dir=output_dir,
             files_path=files_path,
+            max_workers=DOWNLOAD_MAX_WORKERS,
         )
 
     def upload_job_artifact_files(
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 
 from botocore.client import BaseClient
 
@@ -13,17 +13,22 @@ class AWSCompute(Compute):
     def __init__(
         self,
         ec2_client: BaseClient,
-        iam_client: BaseClient,
+        get_iam_client: Callable[[], BaseClient],
         bucket_name: str,
         region_name: str,
         subnet_id: str,
     ):
         self.ec2_client = ec2_client
-        self.iam_client = iam_client
+        # iam is only needed to launch instances, so the client is created on demand
+        self._get_iam_client = get_iam_client
         self.bucket_name = bucket_name
         self.region_name = region_name
         self.subnet_id = subnet_id
 
+    @property
+    def iam_client(self) -> BaseClient:
+        return self._get_iam_client()
+
     def get_request_head(self, job: Job, request_id: Optional[str]) -> RequestHead:
         return runners.get_request_head(
             ec2_client=self.ec2_client,
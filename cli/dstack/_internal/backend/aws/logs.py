@@ -1,5 +1,7 @@
+import threading
+import time
 from datetime import datetime
-from typing import Generator, Optional
+from typing import Dict, Generator, Optional, Tuple
 
 from botocore.client import BaseClient
 
@@ -12,6 +14,15 @@ from dstack._internal.utils.common import (
     timestamps_in_milliseconds_to_datetime,
 )
 
+# How long (in seconds) a log group is assumed to still exist after it was checked or created.
+# Log groups deleted outside the hub are recreated by create_run at most this much later.
+CREATED_LOG_GROUPS_TTL = 600
+
+# (region, log group name) -> when the log group was known to exist,
+# so create_run can skip the CloudWatch round trip
+_created_log_groups: Dict[Tuple[str, str], float] = {}
+_created_log_groups_lock = threading.Lock()
+
 
 def poll_logs(
     storage: Storage,
@@ -24,9 +35,11 @@ def poll_logs(
     descending: bool,
     diagnose: bool,
 ) -> Generator[LogEvent, None, None]:
-    jobs = base_jobs.list_jobs(storage, repo_id, run_name)
-    jobs_map = {j.job_id: j for j in jobs}
+    # Jobs are only needed to fix URLs in log events, so they are loaded on the first event.
+    # This keeps polls that return no new events down to a single CloudWatch call.
+    jobs_map = None
     if diagnose:
+        jobs = base_jobs.list_jobs(storage, repo_id, run_name)
         runner_id = jobs[0].runner_id
         log_group = f"/dstack/runners/{bucket_name}"
         log_stream = runner_id
@@ -54,6 +67,9 @@ def poll_logs(
                 event["timestamp"] = timestamps_in_milliseconds_to_datetime(event["timestamp"])
                 log_event = render_log_event(event)
                 if not diagnose:
+                    if jobs_map is None:
+                        jobs = base_jobs.list_jobs(storage, repo_id, run_name)
+                        jobs_map = {j.job_id: j for j in jobs}
                     log_event = fix_log_event_urls(log_event, jobs_map)
                 yield log_event
     except Exception as e:
@@ -62,6 +78,8 @@ def poll_logs(
             and e.response.get("Error")
             and e.response["Error"].get("Code") == "ResourceNotFoundException"
         ):
+            # The log group may have been deleted, so create_run should check it again
+            _forget_log_group(logs_client, log_group)
             return
         else:
             raise e
@@ -96,6 +114,11 @@ def create_log_groups_if_not_exist(logs_client: BaseClient, bucket_name: str, re
 def _create_log_group_if_not_exists(
     logs_client: BaseClient, bucket_name: str, log_group_name: str
 ):
+    key = (logs_client.meta.region_name, log_group_name)
+    with _created_log_groups_lock:
+        created_at = _created_log_groups.get(key)
+    if created_at is not None and time.monotonic() - created_at < CREATED_LOG_GROUPS_TTL:
+        return
     response = logs_client.describe_log_groups(logGroupNamePrefix=log_group_name)
     if not response["logGroups"] or not any(
         filter(lambda g: g["logGroupName"] == log_group_name, response["logGroups"])
@@ -107,6 +130,13 @@ def _create_log_group_if_not_exists(
                 "dstack_bucket": bucket_name,
             },
         )
+    with _created_log_groups_lock:
+        _created_log_groups[key] = time.monotonic()
+
+
+def _forget_log_group(logs_client: BaseClient, log_group_name: str):
+    with _created_log_groups_lock:
+        _created_log_groups.pop((logs_client.meta.region_name, log_group_name), None)
 
 
 def create_log_stream(logs_client: BaseClient, log_group_name: str, run_name: str):
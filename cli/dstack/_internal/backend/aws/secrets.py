@@ -1,5 +1,5 @@
 import json
-from typing import Optional
+from typing import Callable, Optional
 
 from botocore.client import BaseClient
 
@@ -13,15 +13,24 @@ class AWSSecretsManager(SecretsManager):
     def __init__(
         self,
         secretsmanager_client: BaseClient,
-        iam_client: BaseClient,
-        sts_client: BaseClient,
+        get_iam_client: Callable[[], BaseClient],
+        get_sts_client: Callable[[], BaseClient],
         bucket_name: str,
     ):
         self.secretsmanager_client = secretsmanager_client
-        self.iam_client = iam_client
-        self.sts_client = sts_client
+        # iam and sts are only needed to add secrets, so the clients are created on demand
+        self._get_iam_client = get_iam_client
+        self._get_sts_client = get_sts_client
         self.bucket_name = bucket_name
 
+    @property
+    def iam_client(self) -> BaseClient:
+        return self._get_iam_client()
+
+    @property
+    def sts_client(self) -> BaseClient:
+        return self._get_sts_client()
+
     def get_secret(self, repo_id: str, secret_name: str) -> Optional[Secret]:
         value = _get_secret_value(
             secretsmanager_client=self.secretsmanager_client,
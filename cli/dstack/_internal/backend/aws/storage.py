@@ -1,4 +1,5 @@
-from typing import Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 import botocore.exceptions
 from boto3.s3 import transfer
@@ -7,6 +8,14 @@ from botocore.client import BaseClient
 from dstack._internal.backend.base.storage import SIGNED_URL_EXPIRATION, CloudStorage
 from dstack._internal.core.storage import StorageFile
 
+LIST_FILES_MAX_WORKERS = 8
+
+# Number of concurrent requests S3Transfer makes for a single downloaded file.
+# Files are downloaded concurrently as well, so this is kept below the default of 10.
+TRANSFER_MAX_CONCURRENCY = 4
+
+_download_transfer_config = transfer.TransferConfig(max_concurrency=TRANSFER_MAX_CONCURRENCY)
+
 
 class AWSStorage(CloudStorage):
     def __init__(self, s3_client: BaseClient, bucket_name: str):
@@ -43,36 +52,43 @@ class AWSStorage(CloudStorage):
         return object_keys
 
     def list_files(self, prefix: str, recursive: bool) -> List[StorageFile]:
-        paginator = self.s3_client.get_paginator("list_objects")
-        delimiter = "/"
-        if recursive:
-            delimiter = ""
+        files, prefixes = self._list_prefix(prefix, delimiter="/")
+        if not recursive:
+            return files + [StorageFile(filepath=p) for p in prefixes]
+        # Sub-prefixes are listed concurrently since S3 returns at most 1000 keys per request
+        with ThreadPoolExecutor(max_workers=LIST_FILES_MAX_WORKERS) as executor:
+            for sub_files, _ in executor.map(
+                lambda p: self._list_prefix(p, delimiter=""), prefixes
+            ):
+                files.extend(sub_files)
+        return sorted(files, key=lambda f: f.filepath)
+
+    def _list_prefix(self, prefix: str, delimiter: str) -> Tuple[List[StorageFile], List[str]]:
+        paginator = self.s3_client.get_paginator("list_objects_v2")
         page_iterator = paginator.paginate(
-            Bucket=self.bucket_name, Prefix=prefix, Delimiter=delimiter
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            Delimiter=delimiter,
+            PaginationConfig={"PageSize": 1000},
         )
         files = []
+        prefixes = []
         for page in page_iterator:
             for obj in page.get("Contents") or []:
                 if obj["Size"] > 0:
-                    filepath = obj["Key"]
                     files.append(
                         StorageFile(
-                            filepath=filepath,
+                            filepath=obj["Key"],
                             filesize_in_bytes=obj["Size"],
                         )
                     )
             for obj in page.get("CommonPrefixes") or []:
-                filepath = obj["Prefix"]
-                files.append(
-                    StorageFile(
-                        filepath=filepath,
-                    )
-                )
-        return files
+                prefixes.append(obj["Prefix"])
+        return files, prefixes
 
     def download_file(self, source_path: str, dest_path: str, callback: Callable[[int], None]):
         downloader = transfer.S3Transfer(
-            self.s3_client, transfer.TransferConfig(), transfer.OSUtils()
+            self.s3_client, _download_transfer_config, transfer.OSUtils()
         )
         downloader.download_file(self.bucket_name, source_path, dest_path, callback=callback)
 
@@ -41,6 +41,10 @@ class Backend(ABC):
     def name(self) -> str:
         return self.NAME
 
+    def warm_up(self):
+        # Long-lived processes may call it once to create upfront what the backend creates lazily
+        pass
+
     @abstractmethod
     def predict_instance_type(self, job: Job) -> Optional[InstanceType]:
         pass
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -64,7 +65,12 @@ def download_run_artifact_files(
     artifacts: List[Artifact],
     output_dir: Optional[str],
     files_path: Optional[str],
+    max_workers: int = 1,
 ):
+    """
+    `max_workers` - the number of files downloaded concurrently. Storages that are safe to use
+    from multiple threads may set it above 1.
+    """
     if output_dir is None:
         output_dir = os.getcwd()
     for artifact in artifacts:
@@ -91,12 +97,24 @@ def download_run_artifact_files(
             def callback(size):
                 pbar.update(size)
 
+            artifacts_dir = _get_job_artifacts_dir(repo_id, artifact.job_id)
+            download_paths = []
             for file in files:
-                artifacts_dir = _get_job_artifacts_dir(repo_id, artifact.job_id)
                 source_path = os.path.join(artifacts_dir, artifact.path, file.filepath)
                 dest_path = os.path.join(output_dir, artifact.job_id, artifact.path, file.filepath)
                 Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
-                storage.download_file(source_path, dest_path, callback)
+                download_paths.append((source_path, dest_path))
+            if max_workers == 1:
+                for source_path, dest_path in download_paths:
+                    storage.download_file(source_path, dest_path, callback)
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(storage.download_file, source_path, dest_path, callback)
+                        for source_path, dest_path in download_paths
+                    ]
+                    for future in futures:
+                        future.result()
 
 
 def upload_job_artifact_files(
@@ -1,4 +1,5 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import yaml
 
@@ -8,7 +9,8 @@ from dstack._internal.backend.base.storage import Storage
 from dstack._internal.core.app import AppHead
 from dstack._internal.core.artifact import ArtifactHead
 from dstack._internal.core.job import JobErrorCode, JobHead, JobStatus
-from dstack._internal.core.run import RequestStatus, RunHead, generate_remote_run_name_prefix
+from dstack._internal.core.request import RequestHead, RequestStatus
+from dstack._internal.core.run import RunHead, generate_remote_run_name_prefix
 
 
 def create_run(
@@ -38,29 +40,70 @@ def get_run_heads(
     job_heads: List[JobHead],
     include_request_heads: bool,
     interrupted_job_new_status: JobStatus = JobStatus.FAILED,
+    max_workers: int = 1,
 ) -> List[RunHead]:
+    """
+    `max_workers` - the number of jobs whose request heads are fetched concurrently.
+    Backends with thread-safe storage and compute may set it above 1.
+    """
+    request_heads = {}
+    if include_request_heads:
+        unfinished_job_heads = [j for j in job_heads if j.status.is_unfinished()]
+
+        def get_request_head(job_head: JobHead) -> RequestHead:
+            return _get_request_head(storage, compute, job_head, interrupted_job_new_status)
+
+        if max_workers == 1:
+            request_heads = {j.job_id: get_request_head(j) for j in unfinished_job_heads}
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                request_heads = dict(
+                    zip(
+                        [j.job_id for j in unfinished_job_heads],
+                        executor.map(get_request_head, unfinished_job_heads),
+                    )
+                )
     runs_by_id = {}
     for job_head in job_heads:
         run_id = ",".join([job_head.run_name, job_head.workflow_name or ""])
+        request_head = request_heads.get(job_head.job_id)
         if run_id not in runs_by_id:
-            runs_by_id[run_id] = _create_run(
-                storage, compute, job_head, include_request_heads, interrupted_job_new_status
-            )
+            runs_by_id[run_id] = _create_run(job_head, request_head)
         else:
             run = runs_by_id[run_id]
-            _update_run(
-                storage, compute, run, job_head, include_request_heads, interrupted_job_new_status
-            )
+            _update_run(run, job_head, request_head)
     run_heads = list(sorted(runs_by_id.values(), key=lambda r: r.submitted_at, reverse=True))
     return run_heads
 
 
-def _create_run(
+def _get_request_head(
     storage: Storage,
     compute: Compute,
     job_head: JobHead,
-    include_request_heads: bool,
     interrupted_job_new_status: JobStatus,
+) -> RequestHead:
+    job = jobs.get_job(storage, job_head.repo_ref.repo_id, job_head.job_id)
+    request_id = job.request_id
+    if request_id is None and job.runner_id is not None:
+        runner = runners.get_runner(storage, job.runner_id)
+        if not (runner is None):
+            request_id = runner.request_id
+    request_head = compute.get_request_head(job, request_id)
+    if request_head.status == RequestStatus.NO_CAPACITY:
+        job.status = job_head.status = interrupted_job_new_status
+        if interrupted_job_new_status == JobStatus.FAILED:
+            job.error_code = JobErrorCode.INTERRUPTED_BY_NO_CAPACITY
+        jobs.update_job(storage, job)
+    elif request_head.status == RequestStatus.TERMINATED:
+        job.status = job_head.status = JobStatus.FAILED
+        job.error_code = JobErrorCode.INSTANCE_TERMINATED
+        jobs.update_job(storage, job)
+    return request_head
+
+
+def _create_run(
+    job_head: JobHead,
+    request_head: Optional[RequestHead],
 ) -> RunHead:
     app_heads = (
         list(
@@ -85,26 +128,8 @@ def _create_run(
         else None
     )
     request_heads = None
-    if include_request_heads and job_head.status.is_unfinished():
-        if request_heads is None:
-            request_heads = []
-        job = jobs.get_job(storage, job_head.repo_ref.repo_id, job_head.job_id)
-        request_id = job.request_id
-        if request_id is None and job.runner_id is not None:
-            runner = runners.get_runner(storage, job.runner_id)
-            if not (runner is None):
-                request_id = runner.request_id
-        request_head = compute.get_request_head(job, request_id)
-        request_heads.append(request_head)
-        if request_head.status == RequestStatus.NO_CAPACITY:
-            job.status = job_head.status = interrupted_job_new_status
-            if interrupted_job_new_status == JobStatus.FAILED:
-                job.error_code = JobErrorCode.INTERRUPTED_BY_NO_CAPACITY
-            jobs.update_job(storage, job)
-        elif request_head.status == RequestStatus.TERMINATED:
-            job.status = job_head.status = JobStatus.FAILED
-            job.error_code = JobErrorCode.INSTANCE_TERMINATED
-            jobs.update_job(storage, job)
+    if request_head is not None:
+        request_heads = [request_head]
     run_head = RunHead(
         run_name=job_head.run_name,
         workflow_name=job_head.workflow_name,
@@ -123,12 +148,9 @@ def _create_run(
 
 
 def _update_run(
-    storage: Storage,
-    compute: Compute,
     run: RunHead,
     job_head: JobHead,
-    include_request_heads: bool,
-    interrupted_job_new_status: JobStatus,
+    request_head: Optional[RequestHead],
 ):
     run.submitted_at = min(run.submitted_at, job_head.submitted_at)
     if job_head.artifact_paths:
@@ -155,25 +177,11 @@ def _update_run(
                 )
             )
         )
-    if job_head.status.is_unfinished():
-        if include_request_heads:
+    # The job may have just been marked as failed while fetching its request head
+    if request_head is not None or job_head.status.is_unfinished():
+        if request_head is not None:
             if run.request_heads is None:
                 run.request_heads = []
-            job = jobs.get_job(storage, job_head.repo_ref.repo_id, job_head.job_id)
-            request_id = job.request_id
-            if request_id is None and job.runner_id is not None:
-                runner = runners.get_runner(storage, job.runner_id)
-                request_id = runner.request_id
-            request_head = compute.get_request_head(job, request_id)
             run.request_heads.append(request_head)
-            if request_head.status == RequestStatus.NO_CAPACITY:
-                job.status = job_head.status = interrupted_job_new_status
-                if interrupted_job_new_status == JobStatus.FAILED:
-                    job.error_code = JobErrorCode.INTERRUPTED_BY_NO_CAPACITY
-                jobs.update_job(storage, job)
-            elif request_head.status == RequestStatus.TERMINATED:
-                job.status = job_head.status = JobStatus.FAILED
-                job.error_code = JobErrorCode.INSTANCE_TERMINATED
-                jobs.update_job(storage, job)
         run.status = job_head.status
     run.job_heads.append(job_head)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Tuple
 
 from pydantic import BaseModel
 
@@ -10,8 +10,14 @@ class JobPlan(BaseModel):
     job: Job
     instance_type: InstanceType
 
+    class Config:
+        allow_mutation = False
+
 
 class RunPlan(BaseModel):
     project: str
     hub_user_name: str
-    job_plans: List[JobPlan]
+    job_plans: Tuple[JobPlan, ...]
+
+    class Config:
+        allow_mutation = False
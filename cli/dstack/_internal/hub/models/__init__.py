@@ -311,6 +311,9 @@ class ProjectElementValue(BaseModel):
     value: str
     label: str
 
+    class Config:
+        allow_mutation = False
+
 
 class ProjectElement(BaseModel):
     selected: Optional[str]
@@ -341,6 +344,9 @@ class GCPVPCSubnetProjectElementValue(BaseModel):
     vpc: Optional[str]
     subnet: Optional[str]
 
+    class Config:
+        allow_mutation = False
+
 
 class GCPVPCSubnetProjectElement(BaseModel):
     selected: Optional[str]
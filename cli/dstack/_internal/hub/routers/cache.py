@@ -1,3 +1,4 @@
+import asyncio
 import json
 from typing import Optional
 
@@ -24,6 +25,8 @@ async def get_backend(project: Project) -> Optional[Backend]:
     backend_cls = configurator.get_backend_class()
     backend = await run_async(backend_cls, config)
     cache[key] = backend
+    # Not awaited, so that the request that creates the backend doesn't wait for the warm-up
+    asyncio.get_running_loop().run_in_executor(None, backend.warm_up)
     return cache[key]
 
 
@@ -1,7 +1,9 @@
 from typing import List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
+from pydantic.json import pydantic_encoder
 
 from dstack._internal.backend.base import Backend
 from dstack._internal.core.error import NoMatchingInstanceError
@@ -19,10 +21,10 @@ from dstack._internal.hub.utils.common import run_async
 router = APIRouter(prefix="/api/project", tags=["runs"], dependencies=[Depends(ProjectMember())])
 
 
-@router.post("/{project_name}/runs/get_plan")
+@router.post("/{project_name}/runs/get_plan", response_model=RunPlan)
 async def get_run_plan(
     project_name: str, body: RunsGetPlan, user: User = Depends(Authenticated())
-) -> RunPlan:
+) -> Response:
     project = await get_project(project_name=project_name)
     backend = await get_backend(project)
     job_plans = []
@@ -35,9 +37,17 @@ async def get_run_plan(
                     msg=NoMatchingInstanceError.message, code=NoMatchingInstanceError.code
                 ),
             )
-        job_plans.append(JobPlan(job=job, instance_type=instance_type))
-    run_plan = RunPlan(project=project_name, hub_user_name=user.name, job_plans=job_plans)
-    return run_plan
+        # jobs are validated by the request model and instance types come from the backend,
+        # so the plan is constructed without re-validating them
+        job_plans.append(JobPlan.construct(job=job, instance_type=instance_type))
+    run_plan = RunPlan.construct(
+        project=project_name, hub_user_name=user.name, job_plans=tuple(job_plans)
+    )
+    # The plan is serialized directly to skip FastAPI's response validation and jsonable_encoder
+    return Response(
+        content=orjson.dumps(run_plan.dict(), default=pydantic_encoder),
+        media_type="application/json",
+    )
 
 
 @router.post(
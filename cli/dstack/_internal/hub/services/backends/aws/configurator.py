@@ -1,8 +1,14 @@
-import json
-from typing import Dict, List, Optional, Tuple, Union
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 
 import botocore.exceptions
+import orjson
 from boto3.session import Session
+from botocore.client import BaseClient
+from botocore.credentials import Credentials
 
 from dstack._internal.backend.aws import AwsBackend
 from dstack._internal.backend.aws.config import AWSConfig
@@ -19,6 +25,7 @@ from dstack._internal.hub.models import (
     ProjectElementValue,
 )
 from dstack._internal.hub.services.backends.base import BackendConfigError, Configurator
+from dstack._internal.hub.utils.common import lru_cache_by_digest
 
 regions = [
     ("US East, N. Virginia", "us-east-1"),
@@ -34,6 +41,49 @@ regions = [
     ("Europe, Stockholm", "eu-north-1"),
 ]
 
+REGION_CODES: FrozenSet[str] = frozenset(code for _, code in regions)
+
+REGION_ELEMENT_VALUES: Tuple[ProjectElementValue, ...] = tuple(
+    ProjectElementValue(value=code, label=label) for label, code in regions
+)
+
+# How long (in seconds) successfully validated credentials are trusted without calling STS
+VALID_CREDENTIALS_TTL = 300
+
+# botocore credential methods for credentials obtained from the EC2 instance metadata service or
+# the ECS container credentials endpoint. They are valid by construction, so STS is not called.
+INSTANCE_CREDENTIALS_METHODS = frozenset({"iam-role", "container-role"})
+
+# A digest of the credentials and region, so that secret keys aren't kept in the cache
+_CredentialsKey = str
+
+_valid_credentials_cache: Dict[_CredentialsKey, float] = {}
+_valid_credentials_lock = threading.Lock()
+
+# How long (in seconds) the default credential chain session is reused. The chain is resolved
+# again afterwards, so changes to environment variables or ~/.aws files are eventually picked up.
+DEFAULT_SESSION_TTL = 300
+
+
+class _SessionState:
+    # Resolving credentials reads config files and may query instance metadata, and each new
+    # client resolves endpoints, so a session's credentials and clients are kept along with it.
+    # Sessions are not thread-safe, so they are only used with the lock held; clients are safe
+    # to share.
+    def __init__(self, session: Session):
+        self.session = session
+        self.created_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.credentials_resolved = False
+        self.credentials: Optional[Credentials] = None
+        self.clients: Dict[Tuple[str, Optional[str]], BaseClient] = {}
+
+
+# Only the default credential chain session is shared across configure calls. Every session
+# holds its own copy of the service models, so sessions for access keys are created per call.
+_default_session: Optional[_SessionState] = None
+_default_session_lock = threading.Lock()
+
 
 class AWSConfigurator(Configurator):
     NAME = "aws"
@@ -44,48 +94,79 @@ class AWSConfigurator(Configurator):
     def configure_project(self, config_data: Dict) -> AWSProjectValues:
         config = AWSConfig.deserialize(config_data)
 
-        if config.region_name is not None and config.region_name not in {r[1] for r in regions}:
+        if config.region_name is not None and config.region_name not in REGION_CODES:
             raise BackendConfigError(f"Invalid AWS region {config.region_name}")
 
         project_values = AWSProjectValues()
-        session = Session()
-        if session.region_name is None:
-            session = Session(region_name=config.region_name)
-
-        project_values.default_credentials = self._valid_credentials(session=session)
+        default_session = _get_default_session()
+        default_region_name = _get_region_name(default_session, config.region_name)
 
         credentials_data = config_data.get("credentials")
         if credentials_data is None:
+            project_values.default_credentials = self._valid_credentials(
+                default_session, default_region_name
+            )
             return project_values
 
-        if credentials_data["type"] == "access_key":
-            session = Session(
-                region_name=config.region_name,
-                aws_access_key_id=credentials_data["access_key"],
-                aws_secret_access_key=credentials_data["secret_key"],
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Resolving the default credential chain may query instance metadata, which times
+            # out on hosts outside EC2. With access keys, it runs alongside the access key check
+            # and the listings, and its result is only waited for once they are done.
+            default_credentials_future = executor.submit(
+                self._valid_credentials, default_session, default_region_name
             )
-            if not self._valid_credentials(session=session):
-                self._raise_invalid_credentials_error(
-                    fields=[["credentials", "access_key"], ["credentials", "secret_key"]]
+            session, region_name = default_session, default_region_name
+            if credentials_data["type"] == "access_key":
+                session = _SessionState(
+                    Session(
+                        region_name=config.region_name,
+                        aws_access_key_id=credentials_data["access_key"],
+                        aws_secret_access_key=credentials_data["secret_key"],
+                    )
                 )
-        elif not project_values.default_credentials:
-            self._raise_invalid_credentials_error(fields=[["credentials"]])
+                region_name = _get_region_name(session, config.region_name)
+                if not self._valid_credentials(session, region_name):
+                    self._raise_invalid_credentials_error(
+                        fields=[["credentials", "access_key"], ["credentials", "secret_key"]]
+                    )
+            elif not default_credentials_future.result():
+                self._raise_invalid_credentials_error(fields=[["credentials"]])
 
-        # TODO validate config values
-        project_values.region_name = self._get_hub_regions(default_region=session.region_name)
-        project_values.s3_bucket_name = self._get_hub_buckets(
-            session=session, region=config.region_name, default_bucket=config.bucket_name
-        )
-        project_values.ec2_subnet_id = self._get_hub_subnet(
-            session=session, default_subnet=config.subnet_id
-        )
+            # The clients are only created once the credentials are known to be valid
+            s3_client = _get_session_client(session, "s3", region_name)
+            ec2_client = _get_session_client(session, "ec2", region_name)
+            bucket_future = None
+            if config.bucket_name is not None:
+                bucket_future = executor.submit(
+                    self._validate_hub_bucket,
+                    s3_client=s3_client,
+                    region=config.region_name,
+                    bucket_name=config.bucket_name,
+                )
+            buckets_future = executor.submit(
+                self._get_hub_buckets,
+                s3_client=s3_client,
+                region=config.region_name,
+                default_bucket=config.bucket_name,
+            )
+            subnet_future = executor.submit(
+                self._get_hub_subnet, ec2_client=ec2_client, default_subnet=config.subnet_id
+            )
+
+            # TODO validate config values
+            project_values.region_name = self._get_hub_regions(default_region=region_name)
+            if bucket_future is not None:
+                bucket_future.result()
+            project_values.s3_bucket_name = buckets_future.result()
+            project_values.ec2_subnet_id = subnet_future.result()
+            project_values.default_credentials = default_credentials_future.result()
         return project_values
 
     def create_config_auth_data_from_project_config(
         self, project_config: AWSProjectConfigWithCreds
     ) -> Tuple[Dict, Dict]:
         project_config.s3_bucket_name = project_config.s3_bucket_name.replace("s3://", "")
-        config = AWSProjectConfig.parse_obj(project_config).dict()
+        config = project_config.dict(include=set(AWSProjectConfig.__fields__))
         auth = project_config.credentials.__root__.dict()
         return config, auth
 
@@ -97,12 +178,12 @@ class AWSConfigurator(Configurator):
     def get_project_config_from_project(
         self, project: Project, include_creds: bool
     ) -> Union[AWSProjectConfig, AWSProjectConfigWithCreds]:
-        json_config = json.loads(project.config)
+        json_config = _load_json(project.config)
         region_name = json_config["region_name"]
         s3_bucket_name = json_config["s3_bucket_name"]
         ec2_subnet_id = json_config["ec2_subnet_id"]
         if include_creds:
-            json_auth = json.loads(project.auth)
+            json_auth = _load_json(project.auth)
             return AWSProjectConfigWithCreds(
                 region_name=region_name,
                 region_name_title=region_name,
@@ -117,12 +198,29 @@ class AWSConfigurator(Configurator):
             ec2_subnet_id=ec2_subnet_id,
         )
 
-    def _valid_credentials(self, session: Session) -> bool:
-        sts = session.client("sts")
+    def _valid_credentials(self, session: _SessionState, region_name: Optional[str]) -> bool:
+        credentials = _get_session_credentials(session)
+        if credentials is None:
+            return False
+        if credentials.method in INSTANCE_CREDENTIALS_METHODS:
+            # The credentials were just issued by the instance/container metadata service
+            return True
+        credentials_key = _get_credentials_key(credentials, region_name)
+        with _valid_credentials_lock:
+            validated_at = _valid_credentials_cache.get(credentials_key)
+        if validated_at is not None and time.monotonic() - validated_at < VALID_CREDENTIALS_TTL:
+            return True
         try:
-            sts.get_caller_identity()
+            _get_session_client(session, "sts", region_name).get_caller_identity()
         except botocore.exceptions.ClientError:
             return False
+        now = time.monotonic()
+        with _valid_credentials_lock:
+            for key in [
+                k for k, t in _valid_credentials_cache.items() if now - t >= VALID_CREDENTIALS_TTL
+            ]:
+                del _valid_credentials_cache[key]
+            _valid_credentials_cache[credentials_key] = now
         return True
 
     def _raise_invalid_credentials_error(self, fields: Optional[List[List[str]]] = None):
@@ -134,30 +232,26 @@ class AWSConfigurator(Configurator):
 
     def _get_hub_regions(self, default_region: Optional[str]) -> ProjectElement:
         element = ProjectElement(selected=default_region)
-        for r in regions:
-            element.values.append(ProjectElementValue(value=r[1], label=r[0]))
+        element.values.extend(REGION_ELEMENT_VALUES)
         return element
 
     def _get_hub_buckets(
-        self, session: Session, region: str, default_bucket: Optional[str]
+        self, s3_client: BaseClient, region: str, default_bucket: Optional[str]
     ) -> AWSBucketProjectElement:
-        if default_bucket is not None:
-            self._validate_hub_bucket(session=session, region=region, bucket_name=default_bucket)
         element = AWSBucketProjectElement(selected=default_bucket)
-        s3_client = session.client("s3")
-        response = s3_client.list_buckets()
-        for bucket in response["Buckets"]:
-            element.values.append(
+        paginator = s3_client.get_paginator("list_buckets")
+        for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
+            element.values.extend(
                 AWSBucketProjectElementValue(
                     name=bucket["Name"],
                     created=bucket["CreationDate"].strftime("%d.%m.%Y %H:%M:%S"),
                     region=region,
                 )
+                for bucket in page["Buckets"]
             )
         return element
 
-    def _validate_hub_bucket(self, session: Session, region: str, bucket_name: str):
-        s3_client = session.client("s3")
+    def _validate_hub_bucket(self, s3_client: BaseClient, region: str, bucket_name: str):
         try:
             response = s3_client.head_bucket(Bucket=bucket_name)
             bucket_region = response["ResponseMetadata"]["HTTPHeaders"]["x-amz-bucket-region"]
@@ -180,15 +274,73 @@ class AWSConfigurator(Configurator):
                 )
             raise e
 
-    def _get_hub_subnet(self, session: Session, default_subnet: Optional[str]) -> ProjectElement:
+    def _get_hub_subnet(
+        self, ec2_client: BaseClient, default_subnet: Optional[str]
+    ) -> ProjectElement:
         element = ProjectElement(selected=default_subnet)
-        _ec2 = session.client("ec2")
-        response = _ec2.describe_subnets()
-        for subnet in response["Subnets"]:
-            element.values.append(
-                ProjectElementValue(
-                    value=subnet["SubnetId"],
-                    label=subnet["SubnetId"],
-                )
+        paginator = ec2_client.get_paginator("describe_subnets")
+        for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
+            element.values.extend(
+                ProjectElementValue(value=subnet["SubnetId"], label=subnet["SubnetId"])
+                for subnet in page["Subnets"]
             )
         return element
+
+
+@lru_cache_by_digest(maxsize=512)
+def _load_json(data: str) -> Dict:
+    # Keyed by the column value, so updating a project naturally invalidates the entry.
+    # The returned dict is shared between callers and must not be mutated.
+    return orjson.loads(data)
+
+
+def _get_default_session() -> _SessionState:
+    global _default_session
+    with _default_session_lock:
+        if _default_session is not None and not _is_expired(_default_session):
+            return _default_session
+    # Created outside the lock, since creating a session reads config files
+    new_session = _SessionState(Session())
+    with _default_session_lock:
+        if _default_session is not None and not _is_expired(_default_session):
+            return _default_session
+        _default_session = new_session
+    return new_session
+
+
+def _is_expired(session: _SessionState) -> bool:
+    return time.monotonic() - session.created_at >= DEFAULT_SESSION_TTL
+
+
+def _get_region_name(session: _SessionState, fallback_region_name: Optional[str]) -> Optional[str]:
+    with session.lock:
+        return session.session.region_name or fallback_region_name
+
+
+def _get_session_credentials(session: _SessionState) -> Optional[Credentials]:
+    with session.lock:
+        if not session.credentials_resolved:
+            # A missing default chain is remembered as well, so the chain (and the instance
+            # metadata timeout) isn't walked again on every call
+            session.credentials = session.session.get_credentials()
+            session.credentials_resolved = True
+        return session.credentials
+
+
+def _get_session_client(
+    session: _SessionState, service_name: str, region_name: Optional[str]
+) -> BaseClient:
+    with session.lock:
+        client = session.clients.get((service_name, region_name))
+        if client is None:
+            client = session.session.client(service_name, region_name=region_name)
+            session.clients[(service_name, region_name)] = client
+        return client
+
+
+def _get_credentials_key(credentials: Credentials, region_name: Optional[str]) -> _CredentialsKey:
+    # Refreshable credentials refresh themselves under their own lock
+    credentials = credentials.get_frozen_credentials()
+    return hashlib.sha256(
+        "\0".join([credentials.access_key, credentials.secret_key, region_name or ""]).encode()
+    ).hexdigest()
@@ -1,10 +1,15 @@
-import json
-from typing import Dict, List, Optional, Tuple, Union
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Collection, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import google.auth
+import google.auth.credentials
 import google.auth.exceptions
 import googleapiclient.discovery
+import googleapiclient.discovery_cache
 import googleapiclient.errors
+import orjson
 from google.cloud import compute_v1, storage
 from google.oauth2 import service_account
 
@@ -24,6 +29,7 @@ from dstack._internal.hub.models import (
     ProjectElementValue,
 )
 from dstack._internal.hub.services.backends.base import BackendConfigError, Configurator
+from dstack._internal.hub.utils.common import lru_cache_by_digest
 
 DEFAULT_GEOGRAPHIC_AREA = "North America"
 
@@ -107,17 +113,33 @@ GCP_LOCATIONS = [
     },
 ]
 
+_AREA_ELEMENT_VALUES: Tuple[ProjectElementValue, ...] = tuple(
+    ProjectElementValue(value=name, label=name)
+    for name in sorted(l["name"] for l in GCP_LOCATIONS)
+)
+
+_LOCATION_BY_AREA: Dict[str, Dict] = {l["name"]: l for l in GCP_LOCATIONS}
+
+_REGION_NAMES_BY_AREA: Dict[str, FrozenSet[str]] = {
+    l["name"]: frozenset(l["regions"]) for l in GCP_LOCATIONS
+}
+
 
 class GCPConfigurator(Configurator):
     NAME = "gcp"
 
+    def __init__(self):
+        self.credentials = None
+        self.project_id = None
+        self._services: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+
     def get_backend_class(self) -> type:
         return GCPBackend
 
     def configure_project(self, config_data: Dict) -> GCPProjectValues:
         project_values = GCPProjectValues()
         try:
-            self.credentials, self.project_id = google.auth.default()
+            self.credentials, self.project_id = _get_default_credentials()
         except google.auth.exceptions.DefaultCredentialsError:
             project_values.default_credentials = False
         else:
@@ -130,33 +152,57 @@ class GCPConfigurator(Configurator):
         if credentials_data["type"] == "service_account":
             try:
                 self._auth(credentials_data)
-                storage_client = storage.Client(credentials=self.credentials)
-                storage_client.list_buckets(max_results=1)
             except Exception:
                 self._raise_invalid_credentials_error(fields=[["credentials", "data"]])
         elif not project_values.default_credentials:
             self._raise_invalid_credentials_error(fields=[["credentials"]])
 
-        project_values.area = self._get_hub_geographic_area(config_data.get("area"))
-        location = self._get_location(project_values.area.selected)
-        project_values.region, regions = self._get_hub_region(
-            location=location,
-            default_region=config_data.get("region"),
-        )
-        project_values.zone = self._get_hub_zone(
-            location=location,
-            region=regions.get(project_values.region.selected),
-            default_zone=config_data.get("zone"),
-        )
-        project_values.bucket_name = self._get_hub_buckets(
-            region=project_values.region.selected,
-            default_bucket=config_data.get("bucket_name"),
-        )
-        project_values.vpc_subnet = self._get_hub_vpc_subnet(
-            region=project_values.region.selected,
-            default_vpc=config_data.get("vpc"),
-            default_subnet=config_data.get("subnet"),
+        # An unknown area is rejected below, after the credentials check
+        default_area = config_data.get("area")
+        requested_location = self._get_location(
+            DEFAULT_GEOGRAPHIC_AREA if default_area is None else default_area
         )
+
+        # The listings don't depend on each other and are dominated by network latency
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            regions_future = executor.submit(
+                self._list_regions,
+                requested_location["regions"] if requested_location is not None else [],
+            )
+            buckets_future = executor.submit(self._list_buckets)
+            subnets_future = executor.submit(self._list_subnets_by_region)
+
+            # Listing buckets doubles as the credentials check, so it's joined first
+            try:
+                buckets = buckets_future.result()
+            except Exception:
+                if credentials_data["type"] != "service_account":
+                    raise
+                self._raise_invalid_credentials_error(fields=[["credentials", "data"]])
+
+            project_values.area = self._get_hub_geographic_area(default_area)
+            location = self._get_location(project_values.area.selected)
+            project_values.region, regions = self._get_hub_region(
+                location=location,
+                regions=regions_future.result(),
+                default_region=config_data.get("region"),
+            )
+            project_values.zone = self._get_hub_zone(
+                location=location,
+                region=regions.get(project_values.region.selected),
+                default_zone=config_data.get("zone"),
+            )
+            project_values.bucket_name = self._get_hub_buckets(
+                region=project_values.region.selected,
+                buckets=buckets,
+                default_bucket=config_data.get("bucket_name"),
+            )
+            project_values.vpc_subnet = self._get_hub_vpc_subnet(
+                region=project_values.region.selected,
+                subnets_by_region=subnets_future.result(),
+                default_vpc=config_data.get("vpc"),
+                default_subnet=config_data.get("subnet"),
+            )
         return project_values
 
     def create_config_auth_data_from_project_config(
@@ -193,7 +239,7 @@ class GCPConfigurator(Configurator):
     def get_project_config_from_project(
         self, project: Project, include_creds: bool
     ) -> Union[GCPProjectConfig, GCPProjectConfigWithCreds]:
-        json_config = json.loads(project.config)
+        json_config = _load_json(project.config)
         area = json_config["area"]
         region = json_config["region"]
         zone = json_config["zone"]
@@ -201,7 +247,7 @@ class GCPConfigurator(Configurator):
         vpc = json_config["vpc"]
         subnet = json_config["subnet"]
         if include_creds:
-            json_auth = json.loads(project.auth)
+            json_auth = _load_json(project.auth)
             return GCPProjectConfigWithCreds(
                 credentials=GCPProjectCreds.parse_obj(json_auth),
                 area=area,
@@ -221,63 +267,80 @@ class GCPConfigurator(Configurator):
         )
 
     def _get_hub_geographic_area(self, default_area: Optional[str]) -> ProjectElement:
-        area_names = sorted([l["name"] for l in GCP_LOCATIONS])
         if default_area is None:
             default_area = DEFAULT_GEOGRAPHIC_AREA
-        if default_area not in area_names:
+        if default_area not in _LOCATION_BY_AREA:
             raise BackendConfigError(f"Invalid GCP area {default_area}")
-        element = ProjectElement(selected=default_area)
-        for area_name in area_names:
-            element.values.append(ProjectElementValue(value=area_name, label=area_name))
+        element = ProjectElement.construct(
+            selected=default_area,
+            values=list(_AREA_ELEMENT_VALUES),
+        )
         return element
 
-    def _get_hub_region(
-        self, location: Dict, default_region: Optional[str]
-    ) -> Tuple[ProjectElement, Dict]:
+    def _list_regions(self, region_names: List[str]) -> List[compute_v1.Region]:
+        if len(region_names) == 0:
+            return []
         regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-        regions = regions_client.list(project=self.project_id)
-        region_names = sorted(
-            [r.name for r in regions if r.name in location["regions"]],
-            key=lambda name: (name != location["default_region"], name),
+        request = compute_v1.ListRegionsRequest(
+            project=self.project_id,
+            filter=" OR ".join(f'(name = "{name}")' for name in region_names),
         )
-        if default_region is None:
-            default_region = region_names[0]
-        if default_region not in region_names:
+        return list(regions_client.list(request=request))
+
+    def _list_buckets(self) -> List[storage.Bucket]:
+        storage_client = storage.Client(credentials=self.credentials)
+        return list(storage_client.list_buckets())
+
+    def _list_subnets_by_region(self) -> Dict[str, List[Tuple[str, str]]]:
+        # Indexes (vpc, subnet) pairs by region while the other listings are still in flight
+        networks_client = compute_v1.NetworksClient(credentials=self.credentials)
+        subnets_by_region = defaultdict(list)
+        for network in networks_client.list(project=self.project_id):
+            for subnet in network.subnetworks:
+                subnets_by_region[gcp_utils.get_subnet_region(subnet)].append(
+                    (network.name, gcp_utils.get_subnet_name(subnet))
+                )
+        return subnets_by_region
+
+    def _get_hub_region(
+        self, location: Dict, regions: List[compute_v1.Region], default_region: Optional[str]
+    ) -> Tuple[ProjectElement, Dict]:
+        area_region_names = _REGION_NAMES_BY_AREA[location["name"]]
+        regions_map = {r.name: r for r in regions if r.name in area_region_names}
+        if default_region is not None and default_region not in regions_map:
             raise BackendConfigError(
                 f"Invalid GCP region {default_region} in area {location['name']}"
             )
-        element = ProjectElement(selected=default_region)
-        for region_name in region_names:
-            element.values.append(ProjectElementValue(value=region_name, label=region_name))
-        return element, {r.name: r for r in regions}
+        region_names = _sort_with_preferred_first(regions_map, location["default_region"])
+        if default_region is None:
+            default_region = region_names[0]
+        element = ProjectElement.construct(
+            selected=default_region,
+            values=[ProjectElementValue.construct(value=n, label=n) for n in region_names],
+        )
+        return element, regions_map
 
     def _get_location(self, area: str) -> Optional[Dict]:
-        for location in GCP_LOCATIONS:
-            if location["name"] == area:
-                return location
-        return None
+        return _LOCATION_BY_AREA.get(area)
 
     def _get_hub_zone(
         self, location: Dict, region: compute_v1.Region, default_zone: Optional[str]
     ) -> ProjectElement:
-        zone_names = sorted(
-            [gcp_utils.get_resource_name(z) for z in region.zones],
-            key=lambda name: (name != location["default_zone"], name),
-        )
+        region_zone_names = {gcp_utils.get_resource_name(z) for z in region.zones}
+        if default_zone is not None and default_zone not in region_zone_names:
+            raise BackendConfigError(f"Invalid GCP zone {default_zone} in region {region.name}")
+        zone_names = _sort_with_preferred_first(region_zone_names, location["default_zone"])
         if default_zone is None:
             default_zone = zone_names[0]
-        if default_zone not in zone_names:
-            raise BackendConfigError(f"Invalid GCP zone {default_zone} in region {region.name}")
-        element = ProjectElement(selected=default_zone)
-        for zone_name in zone_names:
-            element.values.append(ProjectElementValue(value=zone_name, label=zone_name))
+        element = ProjectElement.construct(
+            selected=default_zone,
+            values=[ProjectElementValue.construct(value=n, label=n) for n in zone_names],
+        )
         return element
 
     def _get_hub_buckets(
-        self, region: str, default_bucket: Optional[str] = None
+        self, region: str, buckets: List[storage.Bucket], default_bucket: Optional[str] = None
     ) -> ProjectElement:
-        storage_client = storage.Client(credentials=self.credentials)
-        buckets = storage_client.list_buckets()
         bucket_names = [bucket.name for bucket in buckets if bucket.location.lower() == region]
         if default_bucket is not None and default_bucket not in bucket_names:
             raise BackendConfigError(
@@ -285,14 +348,16 @@ class GCPConfigurator(Configurator):
                 code="invalid_bucket",
                 fields=[["bucket_name"]],
             )
-        element = ProjectElement(selected=default_bucket)
-        for bucket_name in bucket_names:
-            element.values.append(ProjectElementValue(value=bucket_name, label=bucket_name))
+        element = ProjectElement.construct(
+            selected=default_bucket,
+            values=[ProjectElementValue.construct(value=n, label=n) for n in bucket_names],
+        )
         return element
 
     def _get_hub_vpc_subnet(
         self,
         region: str,
+        subnets_by_region: Dict[str, List[Tuple[str, str]]],
         default_vpc: Optional[str],
         default_subnet: Optional[str],
     ) -> GCPVPCSubnetProjectElement:
@@ -301,15 +366,7 @@ class GCPConfigurator(Configurator):
         if default_subnet is None:
             default_subnet = "default"
         no_preference_vpc_subnet = ("default", "default")
-        networks_client = compute_v1.NetworksClient(credentials=self.credentials)
-        networks = networks_client.list(project=self.project_id)
-        vpc_subnet_list = []
-        for network in networks:
-            for subnet in network.subnetworks:
-                subnet_region = gcp_utils.get_subnet_region(subnet)
-                if subnet_region != region:
-                    continue
-                vpc_subnet_list.append((network.name, gcp_utils.get_subnet_name(subnet)))
+        vpc_subnet_list = subnets_by_region.get(region, [])
         if (default_vpc, default_subnet) not in vpc_subnet_list:
             raise BackendConfigError(f"Invalid VPC subnet {default_vpc, default_subnet}")
         if (default_vpc, default_subnet) != no_preference_vpc_subnet:
@@ -317,31 +374,46 @@ class GCPConfigurator(Configurator):
         else:
             selected = f"No preference (default)"
         vpc_subnet_list = sorted(vpc_subnet_list, key=lambda t: t != no_preference_vpc_subnet)
-        element = GCPVPCSubnetProjectElement(selected=selected)
-        for vpc, subnet in vpc_subnet_list:
-            element.values.append(
-                GCPVPCSubnetProjectElementValue(
+        element = GCPVPCSubnetProjectElement.construct(
+            selected=selected,
+            values=[
+                GCPVPCSubnetProjectElementValue.construct(
                     vpc=vpc,
                     subnet=subnet,
                     label=f"{subnet} ({vpc})"
                     if (subnet, vpc) != no_preference_vpc_subnet
                     else f"No preference (default)",
                 )
-            )
+                for vpc, subnet in vpc_subnet_list
+            ],
+        )
         return element
 
     def _auth(self, credentials_data: Dict):
         if credentials_data["type"] == "service_account":
-            service_account_info = json.loads(credentials_data["data"])
-            self.credentials = service_account.Credentials.from_service_account_info(
-                info=service_account_info
-            )
+            self.credentials = _get_service_account_credentials(credentials_data["data"])
             self.project_id = self.credentials.project_id
         else:
-            self.credentials, self.project_id = google.auth.default()
+            self.credentials, self.project_id = _get_default_credentials()
+
+    def _iam(self):
+        return self._get_service("iam", "v1")
+
+    def _crm(self):
+        return self._get_service("cloudresourcemanager", "v1")
+
+    def _get_service(self, service_name: str, version: str):
+        # Services are bound to the credentials they were built with,
+        # so they are rebuilt if the credentials have changed since.
+        cached = self._services.get((service_name, version))
+        if cached is not None and cached[0] is self.credentials:
+            return cached[1]
+        service = _build_service(service_name, version, self.credentials)
+        self._services[(service_name, version)] = (self.credentials, service)
+        return service
 
     def _get_or_create_service_account(self, name: str) -> str:
-        iam_service = googleapiclient.discovery.build("iam", "v1", credentials=self.credentials)
+        iam_service = self._iam()
         try:
             service_account = (
                 iam_service.projects()
@@ -369,19 +441,18 @@ class GCPConfigurator(Configurator):
             raise e
 
     def _grant_roles_to_service_account(self, service_account_email: str):
-        service = googleapiclient.discovery.build(
-            "cloudresourcemanager", "v1", credentials=self.credentials
-        )
+        service = self._crm()
         try:
             policy = service.projects().getIamPolicy(resource=self.project_id).execute()
-            self._add_roles_to_policy(
+            policy_updated = self._add_roles_to_policy(
                 policy=policy,
                 service_account_email=service_account_email,
                 roles=self._get_service_account_roles(),
             )
-            service.projects().setIamPolicy(
-                resource=self.project_id, body={"policy": policy}
-            ).execute()
+            if policy_updated:
+                service.projects().setIamPolicy(
+                    resource=self.project_id, body={"policy": policy}
+                ).execute()
         except googleapiclient.errors.HttpError as e:
             if e.status_code == 403:
                 raise BackendConfigError(
@@ -399,17 +470,25 @@ class GCPConfigurator(Configurator):
             "roles/iam.serviceAccountUser",
         ]
 
-    def _add_roles_to_policy(self, policy: Dict, service_account_email: str, roles: List[str]):
+    def _add_roles_to_policy(
+        self, policy: Dict, service_account_email: str, roles: List[str]
+    ) -> bool:
         member = f"serviceAccount:{service_account_email}"
-        for role in roles:
-            policy["bindings"].append({"role": role, "members": [member]})
+        bindings = policy.setdefault("bindings", [])
+        # Conditional bindings don't grant the role unconditionally, so they don't count
+        granted_roles = {
+            b["role"] for b in bindings if "condition" not in b and member in b.get("members", [])
+        }
+        new_bindings = [
+            {"role": role, "members": [member]} for role in roles if role not in granted_roles
+        ]
+        bindings.extend(new_bindings)
+        return len(new_bindings) > 0
 
     def _check_if_can_create_service_account_key(self, service_account_email: str):
         try:
             gcp_auth.create_service_account_key(
-                iam_service=googleapiclient.discovery.build(
-                    "iam", "v1", credentials=self.credentials
-                ),
+                iam_service=self._iam(),
                 project_id=self.project_id,
                 service_account_email=service_account_email,
             )
@@ -425,3 +504,47 @@ class GCPConfigurator(Configurator):
             code="invalid_credentials",
             fields=fields,
         )
+
+
+def _sort_with_preferred_first(names: Collection[str], preferred: str) -> List[str]:
+    sorted_names = sorted(n for n in names if n != preferred)
+    if preferred in names:
+        sorted_names.insert(0, preferred)
+    return sorted_names
+
+
+@lru_cache_by_digest(maxsize=512)
+def _load_json(data: str) -> Dict:
+    # Keyed by the column value, so updating a project naturally invalidates the entry.
+    # The returned dict is shared between callers and must not be mutated.
+    return orjson.loads(data)
+
+
+@lru_cache_by_digest(maxsize=64)
+def _get_service_account_credentials(data: str) -> service_account.Credentials:
+    # Loading the key means parsing both the JSON and the PEM-encoded RSA key.
+    # The credentials refresh their own tokens, so they can be shared between callers.
+    return service_account.Credentials.from_service_account_info(info=orjson.loads(data))
+
+
+def _build_service(service_name: str, version: str, credentials: Any):
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        return googleapiclient.discovery.build(service_name, version, credentials=credentials)
+    # Building the service modifies the document, so every service gets a fresh copy
+    return googleapiclient.discovery.build_from_document(
+        orjson.loads(document), credentials=credentials
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_discovery_document(service_name: str, version: str) -> Optional[str]:
+    # The documents bundled with google-api-python-client, read from disk once per process
+    return googleapiclient.discovery_cache.get_static_doc(service_name, version)
+
+
+@lru_cache(maxsize=1)
+def _get_default_credentials() -> Tuple[google.auth.credentials.Credentials, Optional[str]]:
+    # The ADC lookup reads files and may query the metadata server. Failed lookups
+    # raise and aren't cached, so credentials configured later are still picked up.
+    return google.auth.default()
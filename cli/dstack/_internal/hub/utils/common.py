@@ -1,5 +1,45 @@
 import asyncio
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
 
 
 async def run_async(func, *args):
     return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def lru_cache_by_digest(maxsize: int):
+    """
+    Like `functools.lru_cache` for functions of a single string argument, but keyed by the
+    SHA-256 digest of the argument. Use it when the argument may hold secrets, so that they
+    aren't kept as cache keys for the life of the process.
+    """
+
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        cache: Dict[str, Any] = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(data: str) -> Any:
+            key = hashlib.sha256(data.encode()).hexdigest()
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+            value = func(data)
+            with lock:
+                cache[key] = value
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -1,4 +1,4 @@
-import uuid
+import secrets
 from argparse import ArgumentParser, Namespace
 from typing import Any, Dict, List, Optional
 
@@ -12,6 +12,13 @@ from dstack._internal.providers import Provider
 from dstack._internal.providers.extensions import OpenSSHExtension
 from dstack._internal.providers.ports import filter_reserved_ports, get_map_to_port
 
+_JUPYTER_STATIC_CONFIG = (
+    'echo "c.NotebookApp.allow_root = True" > /root/.jupyter/jupyter_notebook_config.py',
+    "echo \"c.NotebookApp.allow_origin = '*'\" >> /root/.jupyter/jupyter_notebook_config.py",
+    'echo "c.NotebookApp.open_browser = False" >> /root/.jupyter/jupyter_notebook_config.py',
+    "echo \"c.NotebookApp.ip = '0.0.0.0'\" >> /root/.jupyter/jupyter_notebook_config.py",
+)
+
 
 class NotebookProvider(Provider):
     notebook_port = 10000
@@ -64,7 +71,7 @@ class NotebookProvider(Provider):
 
     def create_job_specs(self) -> List[JobSpec]:
         env = {}
-        token = uuid.uuid4().hex
+        token = secrets.token_hex(16)
         env["TOKEN"] = token
         apps = []
         for i, pm in enumerate(filter_reserved_ports(self.ports), start=1):
@@ -112,10 +119,7 @@ class NotebookProvider(Provider):
             "conda install psutil -y",
             "pip install jupyter" + (f"=={self.version}" if self.version else ""),
             "mkdir -p /root/.jupyter",
-            'echo "c.NotebookApp.allow_root = True" > /root/.jupyter/jupyter_notebook_config.py',
-            "echo \"c.NotebookApp.allow_origin = '*'\" >> /root/.jupyter/jupyter_notebook_config.py",
-            'echo "c.NotebookApp.open_browser = False" >> /root/.jupyter/jupyter_notebook_config.py',
-            "echo \"c.NotebookApp.ip = '0.0.0.0'\" >> /root/.jupyter/jupyter_notebook_config.py",
+            *_JUPYTER_STATIC_CONFIG,
         ]
         if self.build_commands:
             commands.extend(self.build_commands)
@@ -70,8 +70,9 @@ def unique_ports_constraint(ports: List[int], error: str = "Port {} is already i
 
 
 def get_map_to_port(ports: Dict[int, PortMapping], port: int) -> Optional[int]:
-    if port in ports:
-        return ports[port].map_to_port
+    pm = ports.get(port)
+    if pm is not None:
+        return pm.map_to_port
     return None
 
 
@@ -0,0 +1,83 @@
+import unittest
+from typing import Dict
+
+from dstack._internal.backend.aws.storage import AWSStorage
+from dstack._internal.core.storage import StorageFile
+
+
+class ListObjectsV2PaginatorMock:
+    def __init__(self, objects: Dict[str, int]):
+        self.objects = objects
+
+    def paginate(self, Bucket: str, Prefix: str, Delimiter: str, PaginationConfig: Dict):
+        contents = []
+        common_prefixes = []
+        for key in sorted(self.objects):
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                common_prefix = Prefix + rest[: rest.index(Delimiter) + 1]
+                if common_prefix not in common_prefixes:
+                    common_prefixes.append(common_prefix)
+                continue
+            contents.append({"Key": key, "Size": self.objects[key]})
+        yield {
+            "Contents": contents,
+            "CommonPrefixes": [{"Prefix": p} for p in common_prefixes],
+        }
+
+
+class S3ClientMock:
+    def __init__(self, objects: Dict[str, int]):
+        self.objects = objects
+
+    def get_paginator(self, operation_name: str) -> ListObjectsV2PaginatorMock:
+        assert operation_name == "list_objects_v2"
+        return ListObjectsV2PaginatorMock(self.objects)
+
+
+objects = {
+    "artifacts/run-1/a.txt": 3,
+    "artifacts/run-1/dir/": 0,
+    "artifacts/run-1/dir/b.txt": 5,
+    "artifacts/run-1/dir/sub/c.txt": 7,
+    "artifacts/run-1/empty/": 0,
+    "artifacts/run-1/z.txt": 1,
+    "artifacts/run-10/d.txt": 9,
+}
+
+
+class TestListFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = AWSStorage(s3_client=S3ClientMock(objects), bucket_name="bucket")
+
+    def test_not_recursive(self):
+        self.assertEqual(
+            self.storage.list_files("artifacts/run-1/", recursive=False),
+            [
+                StorageFile(filepath="artifacts/run-1/a.txt", filesize_in_bytes=3),
+                StorageFile(filepath="artifacts/run-1/z.txt", filesize_in_bytes=1),
+                StorageFile(filepath="artifacts/run-1/dir/"),
+                StorageFile(filepath="artifacts/run-1/empty/"),
+            ],
+        )
+
+    def test_recursive(self):
+        self.assertEqual(
+            self.storage.list_files("artifacts/run-1/", recursive=True),
+            [
+                StorageFile(filepath="artifacts/run-1/a.txt", filesize_in_bytes=3),
+                StorageFile(filepath="artifacts/run-1/dir/b.txt", filesize_in_bytes=5),
+                StorageFile(filepath="artifacts/run-1/dir/sub/c.txt", filesize_in_bytes=7),
+                StorageFile(filepath="artifacts/run-1/z.txt", filesize_in_bytes=1),
+            ],
+        )
+
+    def test_recursive_matches_flat_listing(self):
+        flat_listing = [
+            StorageFile(filepath=key, filesize_in_bytes=size)
+            for key, size in sorted(objects.items())
+            if key.startswith("artifacts/run-1") and size > 0
+        ]
+        self.assertEqual(self.storage.list_files("artifacts/run-1", recursive=True), flat_listing)
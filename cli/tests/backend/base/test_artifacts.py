@@ -0,0 +1,63 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from dstack._internal.backend.base import artifacts
+from dstack._internal.core.artifact import Artifact
+from dstack._internal.core.storage import StorageFile
+
+
+class TestDownloadRunArtifactFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        self.artifacts = [
+            Artifact(
+                job_id="job-1",
+                name="output/",
+                path="output/",
+                files=[
+                    StorageFile(filepath="a.txt", filesize_in_bytes=3),
+                    StorageFile(filepath="dir/b.txt", filesize_in_bytes=5),
+                ],
+            )
+        ]
+
+    def test_downloads_all_files(self):
+        for max_workers in [1, 4]:
+            with self.subTest(max_workers=max_workers), tempfile.TemporaryDirectory() as tmp:
+                storage = mock.Mock()
+                artifacts.download_run_artifact_files(
+                    storage,
+                    "repo",
+                    self.artifacts,
+                    output_dir=tmp,
+                    files_path=None,
+                    max_workers=max_workers,
+                )
+                self.assertEqual(
+                    sorted(c.args[:2] for c in storage.download_file.call_args_list),
+                    [
+                        (
+                            "artifacts/repo/job-1/output/a.txt",
+                            os.path.join(tmp, "job-1", "output", "a.txt"),
+                        ),
+                        (
+                            "artifacts/repo/job-1/output/dir/b.txt",
+                            os.path.join(tmp, "job-1", "output", "dir", "b.txt"),
+                        ),
+                    ],
+                )
+                self.assertTrue(os.path.isdir(os.path.join(tmp, "job-1", "output", "dir")))
+
+    def test_downloads_inline_with_one_worker(self):
+        threads = []
+        storage = mock.Mock()
+        storage.download_file.side_effect = lambda *args: threads.append(
+            threading.current_thread()
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            artifacts.download_run_artifact_files(
+                storage, "repo", self.artifacts, output_dir=tmp, files_path=None
+            )
+        self.assertEqual(threads, [threading.current_thread()] * 2)
@@ -0,0 +1,104 @@
+import unittest
+from typing import Dict
+from unittest import mock
+
+from dstack._internal.backend.base import runs
+from dstack._internal.core.job import JobErrorCode, JobHead, JobStatus
+from dstack._internal.core.repo import RepoRef
+from dstack._internal.core.request import RequestHead, RequestStatus
+
+
+def create_job_head(job_id: str, status: JobStatus, submitted_at: int) -> JobHead:
+    return JobHead(
+        job_id=job_id,
+        repo_ref=RepoRef(repo_id="repo"),
+        hub_user_name="user",
+        run_name="run-1",
+        workflow_name=None,
+        provider_name="bash",
+        status=status,
+        submitted_at=submitted_at,
+    )
+
+
+def create_compute(request_statuses: Dict[str, RequestStatus]) -> mock.Mock:
+    compute = mock.Mock()
+    compute.get_request_head.side_effect = lambda job, request_id: RequestHead(
+        job_id=job.job_id, status=request_statuses[job.job_id]
+    )
+    return compute
+
+
+class TestGetRunHeads(unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = mock.Mock()
+        self.jobs = {}
+
+        def get_job(storage, repo_id, job_id):
+            job = mock.Mock(job_id=job_id, request_id=f"request-{job_id}", runner_id=None)
+            self.jobs[job_id] = job
+            return job
+
+        patcher = mock.patch.object(runs.jobs, "get_job", side_effect=get_job)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(runs.jobs, "update_job")
+        self.update_job = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_capacity_job_fails_multi_job_run(self):
+        for max_workers in [1, 4]:
+            with self.subTest(max_workers=max_workers):
+                job_heads = [
+                    create_job_head("job-1", JobStatus.RUNNING, submitted_at=1),
+                    create_job_head("job-2", JobStatus.SUBMITTED, submitted_at=2),
+                ]
+                compute = create_compute(
+                    {"job-1": RequestStatus.RUNNING, "job-2": RequestStatus.NO_CAPACITY}
+                )
+                run_heads = runs.get_run_heads(
+                    self.storage,
+                    compute,
+                    job_heads,
+                    include_request_heads=True,
+                    max_workers=max_workers,
+                )
+                self.assertEqual(len(run_heads), 1)
+                run_head = run_heads[0]
+                self.assertEqual(run_head.status, JobStatus.FAILED)
+                self.assertEqual(run_head.submitted_at, 1)
+                self.assertEqual(
+                    [r.status for r in run_head.request_heads],
+                    [RequestStatus.RUNNING, RequestStatus.NO_CAPACITY],
+                )
+                self.assertEqual(job_heads[1].status, JobStatus.FAILED)
+                self.assertEqual(
+                    self.jobs["job-2"].error_code, JobErrorCode.INTERRUPTED_BY_NO_CAPACITY
+                )
+                self.update_job.assert_called_with(self.storage, self.jobs["job-2"])
+
+    def test_finished_job_keeps_run_status(self):
+        job_heads = [
+            create_job_head("job-1", JobStatus.RUNNING, submitted_at=1),
+            create_job_head("job-2", JobStatus.DONE, submitted_at=2),
+        ]
+        compute = create_compute({"job-1": RequestStatus.RUNNING})
+        run_heads = runs.get_run_heads(
+            self.storage, compute, job_heads, include_request_heads=True
+        )
+        self.assertEqual(run_heads[0].status, JobStatus.RUNNING)
+        self.assertEqual(len(run_heads[0].request_heads), 1)
+        compute.get_request_head.assert_called_once()
+
+    def test_without_request_heads(self):
+        job_heads = [
+            create_job_head("job-1", JobStatus.DONE, submitted_at=1),
+            create_job_head("job-2", JobStatus.RUNNING, submitted_at=2),
+        ]
+        compute = create_compute({})
+        run_heads = runs.get_run_heads(
+            self.storage, compute, job_heads, include_request_heads=False
+        )
+        self.assertEqual(run_heads[0].status, JobStatus.RUNNING)
+        self.assertIsNone(run_heads[0].request_heads)
+        compute.get_request_head.assert_not_called()
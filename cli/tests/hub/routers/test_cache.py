@@ -0,0 +1,37 @@
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+from dstack._internal.hub.routers import cache
+
+
+class TestGetBackend:
+    @pytest.mark.asyncio
+    async def test_does_not_wait_for_warm_up(self):
+        warm_up_started = threading.Event()
+        warm_up_allowed = threading.Event()
+
+        class Backend:
+            def __init__(self, config):
+                self.config = config
+
+            def warm_up(self):
+                warm_up_started.set()
+                warm_up_allowed.wait(timeout=5)
+
+        configurator = mock.Mock()
+        configurator.get_backend_class.return_value = Backend
+        project = mock.Mock(config=json.dumps({}), auth=json.dumps({}))
+        project.name = "test_cache_project"
+        with mock.patch.object(cache, "get_configurator", return_value=configurator):
+            try:
+                backend = await cache.get_backend(project)
+                assert isinstance(backend, Backend)
+                assert cache.cache[project.name] is backend
+                assert warm_up_started.wait(timeout=5)
+                assert not warm_up_allowed.is_set()
+            finally:
+                warm_up_allowed.set()
+                cache.clear_backend_cache(project.name)
@@ -0,0 +1,201 @@
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import botocore.exceptions
+from botocore.credentials import Credentials
+
+from dstack._internal.hub.services.backends.aws import configurator
+from dstack._internal.hub.services.backends.aws.configurator import AWSConfigurator
+from dstack._internal.hub.services.backends.base import BackendConfigError
+
+
+def create_session(credentials=None, region_name=None) -> mock.Mock:
+    session = mock.Mock(region_name=region_name)
+    session.get_credentials.return_value = credentials
+    return session
+
+
+def create_invalid_sts_client() -> mock.Mock:
+    sts_client = mock.Mock()
+    sts_client.get_caller_identity.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "InvalidClientTokenId"}}, "GetCallerIdentity"
+    )
+    return sts_client
+
+
+class ConfiguratorTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1000.0
+        patcher = mock.patch.object(configurator.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(configurator, "_valid_credentials_cache", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(configurator, "_default_session", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.configurator = AWSConfigurator()
+
+
+class TestValidCredentials(ConfiguratorTestCase):
+    def test_caches_successful_check(self):
+        session = create_session(Credentials("AKIA1", "secret1", method="explicit"))
+        session_state = configurator._SessionState(session)
+        self.assertTrue(self.configurator._valid_credentials(session_state, "us-east-1"))
+        self.now += configurator.VALID_CREDENTIALS_TTL - 1
+        self.assertTrue(self.configurator._valid_credentials(session_state, "us-east-1"))
+        session.client.assert_called_once_with("sts", region_name="us-east-1")
+        session.client.return_value.get_caller_identity.assert_called_once()
+
+    def test_checks_again_after_ttl(self):
+        session = create_session(Credentials("AKIA1", "secret1", method="explicit"))
+        session_state = configurator._SessionState(session)
+        self.configurator._valid_credentials(session_state, "us-east-1")
+        self.now += configurator.VALID_CREDENTIALS_TTL
+        self.assertTrue(self.configurator._valid_credentials(session_state, "us-east-1"))
+        self.assertEqual(session.client.return_value.get_caller_identity.call_count, 2)
+
+    def test_prunes_expired_checks_and_does_not_keep_secrets(self):
+        for i in range(3):
+            session = create_session(Credentials(f"AKIA{i}", f"secret{i}", method="explicit"))
+            self.configurator._valid_credentials(configurator._SessionState(session), None)
+            self.now += configurator.VALID_CREDENTIALS_TTL
+        self.assertEqual(len(configurator._valid_credentials_cache), 1)
+        (key,) = configurator._valid_credentials_cache
+        self.assertNotIn("secret2", key)
+        self.assertNotIn("AKIA2", key)
+
+    def test_does_not_cache_invalid_credentials(self):
+        session = create_session(Credentials("AKIA1", "secret1", method="explicit"))
+        session.client.return_value = create_invalid_sts_client()
+        session_state = configurator._SessionState(session)
+        self.assertFalse(self.configurator._valid_credentials(session_state, None))
+        self.assertFalse(self.configurator._valid_credentials(session_state, None))
+        self.assertEqual(configurator._valid_credentials_cache, {})
+
+    def test_no_credentials(self):
+        session = create_session(credentials=None)
+        session_state = configurator._SessionState(session)
+        self.assertFalse(self.configurator._valid_credentials(session_state, None))
+        self.assertFalse(self.configurator._valid_credentials(session_state, None))
+        session.get_credentials.assert_called_once()
+        session.client.assert_not_called()
+
+    def test_skips_sts_for_instance_credentials(self):
+        for method in ["iam-role", "container-role"]:
+            with self.subTest(method=method):
+                session = create_session(Credentials("ASIA1", "secret1", method=method))
+                session_state = configurator._SessionState(session)
+                self.assertTrue(self.configurator._valid_credentials(session_state, None))
+                session.client.assert_not_called()
+
+
+class TestGetDefaultSession(ConfiguratorTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = mock.patch.object(
+            configurator, "Session", side_effect=lambda: create_session(region_name="eu-west-1")
+        )
+        self.session_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reuses_session_within_ttl(self):
+        session = configurator._get_default_session()
+        self.now += configurator.DEFAULT_SESSION_TTL - 1
+        self.assertIs(configurator._get_default_session(), session)
+        self.session_cls.assert_called_once()
+
+    def test_replaces_expired_session(self):
+        session = configurator._get_default_session()
+        self.now += configurator.DEFAULT_SESSION_TTL
+        new_session = configurator._get_default_session()
+        self.assertIsNot(new_session, session)
+        self.assertIs(configurator._get_default_session(), new_session)
+        self.assertEqual(self.session_cls.call_count, 2)
+
+
+class TestConfigureProject(ConfiguratorTestCase):
+    def test_invalid_access_key(self):
+        default_session = create_session(region_name="eu-west-1")
+        access_key_session = create_session(Credentials("AKIA1", "secret1", method="explicit"))
+        access_key_session.client.return_value = create_invalid_sts_client()
+        sessions = {None: default_session, "AKIA1": access_key_session}
+        with mock.patch.object(
+            configurator,
+            "Session",
+            side_effect=lambda **kwargs: sessions[kwargs.get("aws_access_key_id")],
+        ) as session_cls:
+            for _ in range(2):
+                with self.assertRaises(BackendConfigError):
+                    self.configurator.configure_project(
+                        {
+                            "type": "aws",
+                            "region_name": "eu-west-1",
+                            "credentials": {
+                                "type": "access_key",
+                                "access_key": "AKIA1",
+                                "secret_key": "secret1",
+                            },
+                        }
+                    )
+        # Only the default session is shared between calls
+        self.assertEqual(session_cls.call_count, 3)
+        # No s3 and ec2 clients are created for invalid credentials
+        access_key_session.client.assert_called_with("sts", region_name="eu-west-1")
+        self.assertEqual(access_key_session.client.call_count, 2)
+
+    def test_access_key_does_not_wait_for_default_credentials(self):
+        listed = threading.Event()
+        waited = []
+
+        def get_default_credentials():
+            waited.append(listed.wait(timeout=5))
+
+        default_session = create_session(region_name="eu-west-1")
+        default_session.get_credentials.side_effect = get_default_credentials
+        access_key_session = create_session(Credentials("AKIA1", "secret1", method="explicit"))
+        client = access_key_session.client.return_value
+        client.get_paginator.return_value.paginate.side_effect = lambda **kwargs: (
+            listed.set() or []
+        )
+        sessions = {None: default_session, "AKIA1": access_key_session}
+        with mock.patch.object(
+            configurator,
+            "Session",
+            side_effect=lambda **kwargs: sessions[kwargs.get("aws_access_key_id")],
+        ):
+            project_values = self.configurator.configure_project(
+                {
+                    "type": "aws",
+                    "region_name": "eu-west-1",
+                    "credentials": {
+                        "type": "access_key",
+                        "access_key": "AKIA1",
+                        "secret_key": "secret1",
+                    },
+                }
+            )
+        self.assertEqual(waited, [True])
+        self.assertFalse(project_values.default_credentials)
+        self.assertEqual(project_values.ec2_subnet_id.values, [])
+
+
+class TestGetHubBuckets(unittest.TestCase):
+    def test_lists_all_pages(self):
+        created = datetime(2023, 5, 1, 12, 30, 0)
+        s3_client = mock.Mock()
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Buckets": [{"Name": "bucket-1", "CreationDate": created}]},
+            {"Buckets": [{"Name": "bucket-2", "CreationDate": created}]},
+        ]
+        element = AWSConfigurator()._get_hub_buckets(
+            s3_client=s3_client, region="eu-west-1", default_bucket="bucket-2"
+        )
+        s3_client.get_paginator.assert_called_once_with("list_buckets")
+        self.assertEqual(element.selected, "bucket-2")
+        self.assertEqual([v.name for v in element.values], ["bucket-1", "bucket-2"])
+        self.assertEqual(element.values[0].created, "01.05.2023 12:30:00")
+        self.assertEqual(element.values[0].region, "eu-west-1")
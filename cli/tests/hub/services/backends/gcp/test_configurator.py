@@ -0,0 +1,75 @@
+import unittest
+
+from dstack._internal.hub.services.backends.gcp.configurator import GCPConfigurator
+
+service_account_email = "bucket-sa@project.iam.gserviceaccount.com"
+member = f"serviceAccount:{service_account_email}"
+
+
+class TestAddRolesToPolicy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.configurator = GCPConfigurator()
+
+    def test_adds_bindings(self):
+        policy = {"bindings": [{"role": "roles/viewer", "members": ["user:admin@example.com"]}]}
+        updated = self.configurator._add_roles_to_policy(
+            policy, service_account_email, ["roles/compute.admin", "roles/storage.admin"]
+        )
+        self.assertTrue(updated)
+        self.assertEqual(
+            policy["bindings"],
+            [
+                {"role": "roles/viewer", "members": ["user:admin@example.com"]},
+                {"role": "roles/compute.admin", "members": [member]},
+                {"role": "roles/storage.admin", "members": [member]},
+            ],
+        )
+
+    def test_repeated_call_does_not_duplicate_bindings(self):
+        roles = ["roles/compute.admin", "roles/storage.admin"]
+        policy = {"bindings": []}
+        self.configurator._add_roles_to_policy(policy, service_account_email, roles)
+        updated = self.configurator._add_roles_to_policy(policy, service_account_email, roles)
+        self.assertFalse(updated)
+        self.assertEqual(len(policy["bindings"]), 2)
+
+    def test_role_granted_in_shared_binding(self):
+        policy = {
+            "bindings": [
+                {"role": "roles/compute.admin", "members": ["user:admin@example.com", member]}
+            ]
+        }
+        updated = self.configurator._add_roles_to_policy(
+            policy, service_account_email, ["roles/compute.admin", "roles/storage.admin"]
+        )
+        self.assertTrue(updated)
+        self.assertEqual(
+            policy["bindings"][1:], [{"role": "roles/storage.admin", "members": [member]}]
+        )
+
+    def test_conditional_binding_does_not_count(self):
+        conditional_binding = {
+            "role": "roles/compute.admin",
+            "members": [member],
+            "condition": {"title": "expires", "expression": "request.time < timestamp('2030')"},
+        }
+        policy = {"bindings": [conditional_binding]}
+        updated = self.configurator._add_roles_to_policy(
+            policy, service_account_email, ["roles/compute.admin"]
+        )
+        self.assertTrue(updated)
+        self.assertEqual(
+            policy["bindings"],
+            [conditional_binding, {"role": "roles/compute.admin", "members": [member]}],
+        )
+
+    def test_missing_bindings_key(self):
+        policy = {"etag": "BwX"}
+        updated = self.configurator._add_roles_to_policy(
+            policy, service_account_email, ["roles/compute.admin"]
+        )
+        self.assertTrue(updated)
+        self.assertEqual(
+            policy,
+            {"etag": "BwX", "bindings": [{"role": "roles/compute.admin", "members": [member]}]},
+        )
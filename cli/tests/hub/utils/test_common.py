@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+
+from dstack._internal.hub.utils.common import lru_cache_by_digest
+
+
+class TestLruCacheByDigest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.load = mock.Mock(side_effect=lambda data: {"data": data})
+        self.cached_load = lru_cache_by_digest(maxsize=2)(self.load)
+
+    def test_caches_results(self):
+        value = self.cached_load("secret-1")
+        self.assertIs(self.cached_load("secret-1"), value)
+        self.load.assert_called_once_with("secret-1")
+
+    def test_evicts_least_recently_used(self):
+        self.cached_load("secret-1")
+        self.cached_load("secret-2")
+        self.cached_load("secret-1")
+        self.cached_load("secret-3")
+        self.cached_load("secret-1")
+        self.cached_load("secret-2")
+        self.assertEqual(
+            [c.args[0] for c in self.load.call_args_list],
+            ["secret-1", "secret-2", "secret-3", "secret-2"],
+        )
+
+    def test_cache_clear(self):
+        self.cached_load("secret-1")
+        self.cached_load.cache_clear()
+        self.cached_load("secret-1")
+        self.assertEqual(self.load.call_count, 2)
@@ -87,6 +87,7 @@ setup(
         "grpcio>=1.50",  # indirect
         "filelock",
         "watchfiles",
+        "orjson",
     ],
     extras_require={
         "aws": [